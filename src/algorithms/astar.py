@@ -1,5 +1,7 @@
-from queue import PriorityQueue
+import functools
+import heapq
 import typing as t
+from array import array
 
 from grid import GridMatrix, Cell
 from .base import SolveStep, PathFindingAlgorithm
@@ -8,6 +10,24 @@ from .base import SolveStep, PathFindingAlgorithm
 class AStarAlgorithm(PathFindingAlgorithm):
     """A* pathfinding algorithm."""
 
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _distances(grid_rows: int, grid_columns: int, goal: Cell) -> array:
+        """
+        Manhattan distance from every padded-layout cell id to the goal.
+
+        The table is built once per grid size and goal and shared by every
+        search towards that goal, so a relaxation reads its heuristic with
+        one lookup.
+        """
+        goal_x, goal_y = goal[0] + 1, goal[1] + 1
+        column_distances = [abs(y - goal_y) for y in range(grid_columns + 2)]
+        distances = array('q')
+        for x in range(grid_rows + 2):
+            row_distance = abs(x - goal_x)
+            distances.extend([row_distance + d for d in column_distances])
+        return distances
+
     @classmethod
     def solve(
             cls,
@@ -15,35 +35,59 @@ class AStarAlgorithm(PathFindingAlgorithm):
             source: Cell,
             target: Cell,
     ) -> t.List[Cell]:
-        """Solve using A* algorithm."""
-        frontier = PriorityQueue()
-        frontier.put((0, source))
-
-        came_from: t.Dict[Cell, t.Optional[Cell]] = dict()
-        cost_so_far: t.Dict[Cell, float] = dict()
-        came_from[source] = None
-        cost_so_far[source] = 0
-
-        while not frontier.empty():
-            _, current = frontier.get()
-
-            if current == target:
+        """
+        Solve using A* algorithm.
+
+        Frontier entries are packed into single ints, (f * span + h) * size
+        + id, which heapq compares much faster than tuples. Among equal f
+        the entry with the smaller h, i.e. the one closer to the target,
+        is expanded first. Entries left behind by a later improvement are
+        skipped when popped.
+        """
+        walls = cls._walls(grid)
+        parities = cls._parities(grid.rows, grid.columns)
+        steps = cls._neighbor_steps(grid.columns)
+        source_id = cls._cell_id(grid, source)
+        target_id = cls._cell_id(grid, target)
+        distances = cls._distances(grid.rows, grid.columns, target)
+        scale = cls.COST_SCALE
+
+        size = len(walls)
+        key_span = (grid.rows + grid.columns) * size
+        frontier: t.List[int] = [source_id]
+        push, pop = heapq.heappush, heapq.heappop
+
+        came_from = array('i', [-1]) * size
+        cost_so_far = array('q', [cls.UNREACHED]) * size
+        queued_f = array('q', [0]) * size
+        came_from[source_id] = source_id
+        cost_so_far[source_id] = 0
+
+        while frontier:
+            key = pop(frontier)
+            current_id = key % size
+            if key // key_span != queued_f[current_id]:
+                continue
+
+            if current_id == target_id:
                 break
 
-            for next_node in grid.neighbors(current):
-                next_cost = cls._get_cost(current, next_node)
-                new_cost = cost_so_far[current] + next_cost
+            current_cost = cost_so_far[current_id]
+            for offset, next_cost in steps[parities[current_id]]:
+                next_id = current_id + offset
+                if walls[next_id]:
+                    continue
 
-                if (
-                        next_node not in cost_so_far or
-                        new_cost < cost_so_far[next_node]
-                ):
-                    cost_so_far[next_node] = new_cost
-                    priority = new_cost + cls._heuristic(next_node, target)
-                    frontier.put((priority, next_node))
-                    came_from[next_node] = current
+                new_cost = current_cost + next_cost
+                if new_cost < cost_so_far[next_id]:
+                    cost_so_far[next_id] = new_cost
+                    h = distances[next_id]
+                    priority = new_cost + scale * h
+                    queued_f[next_id] = priority
+                    push(frontier, priority * key_span + h * size + next_id)
+                    came_from[next_id] = current_id
 
-        return cls.reconstruct_path(came_from, source, target)
+        return cls._reconstruct_path_ids(grid, came_from, source_id, target_id)
 
     @classmethod
     def solve_trace(
@@ -53,38 +97,47 @@ class AStarAlgorithm(PathFindingAlgorithm):
             target: Cell,
     ) -> t.Iterator[SolveStep]:
         """Yield steps for A* visualization."""
-        frontier = PriorityQueue()
-        frontier.put((0, source))
-
-        came_from: t.Dict[Cell, t.Optional[Cell]] = {}
-        cost_so_far: t.Dict[Cell, float] = {}
-
-        came_from[source] = None
-        cost_so_far[source] = 0
-
-        while not frontier.empty():
-            _, current = frontier.get()
-            if current == target:
+        walls = cls._walls(grid)
+        parities = cls._parities(grid.rows, grid.columns)
+        cells = cls._id_cells(grid.rows, grid.columns)
+        steps = cls._neighbor_steps(grid.columns)
+        source_id = cls._cell_id(grid, source)
+        target_id = cls._cell_id(grid, target)
+        distances = cls._distances(grid.rows, grid.columns, target)
+        scale = cls.COST_SCALE
+
+        size = len(walls)
+        key_span = (grid.rows + grid.columns) * size
+        frontier: t.List[int] = [source_id]
+        push, pop = heapq.heappush, heapq.heappop
+
+        cost_so_far = array('q', [cls.UNREACHED]) * size
+        queued_f = array('q', [0]) * size
+        cost_so_far[source_id] = 0
+
+        while frontier:
+            key = pop(frontier)
+            current_id = key % size
+            if key // key_span != queued_f[current_id]:
+                continue
+
+            if current_id == target_id:
                 break
 
-            for next_node in grid.neighbors(current):
-                next_cost = cls._get_cost(current, next_node)
-                new_cost = cost_so_far[current] + next_cost
-
-                yield SolveStep(selected_node=next_node, from_node=current)
-
-                if (
-                        next_node not in cost_so_far or
-                        new_cost < cost_so_far[next_node]
-                ):
-                    cost_so_far[next_node] = new_cost
-                    priority = new_cost + cls._heuristic(next_node, target)
-                    frontier.put((priority, next_node))
-                    came_from[next_node] = current
-
-    @staticmethod
-    def _heuristic(a: Cell, b: Cell) -> float:
-        """Calculate the heuristic (Manhattan distance) between two points."""
-        x1, y1 = a
-        x2, y2 = b
-        return abs(x1 - x2) + abs(y1 - y2)
+            current = cells[current_id]
+            current_cost = cost_so_far[current_id]
+            for offset, next_cost in steps[parities[current_id]]:
+                next_id = current_id + offset
+                if walls[next_id]:
+                    continue
+
+                new_cost = current_cost + next_cost
+                accepted = new_cost < cost_so_far[next_id]
+                yield SolveStep(cells[next_id], current, accepted)
+
+                if accepted:
+                    cost_so_far[next_id] = new_cost
+                    h = distances[next_id]
+                    priority = new_cost + scale * h
+                    queued_f[next_id] = priority
+                    push(frontier, priority * key_span + h * size + next_id)
@@ -1,21 +1,40 @@
-import dataclasses as dc
+import functools
 import typing as t
 from abc import ABC, abstractmethod
+from array import array
 
 from grid import GridMatrix, Cell
 
 
-@dc.dataclass
-class SolveStep:
-    """Represents a single step in the solving process."""
+def _get_cost(from_node: Cell, to_node: Cell) -> float:
+    """
+    Calculate the cost of moving from one node to an adjacent one.
+
+    Moves along x from cells with even coordinate sum and moves along y
+    from cells with odd sum are nudged up, so ties favour staircase paths.
+    """
+    x1, y1 = from_node
+    y2 = to_node[1]
+    return 1 + 0.001 * (((x1 + y1) & 1) ^ (y1 == y2))
+
+
+class SolveStep(t.NamedTuple):
+    """
+    Represents a single step in the solving process: a neighbor examined
+    from an expanded node, and whether it got from_node as its new parent.
+    """
 
     selected_node: Cell
     from_node: Cell
+    accepted: bool
 
 
 class PathFindingAlgorithm(ABC):
     """Abstract base class for pathfinding algorithms."""
 
+    COST_SCALE: t.ClassVar[int] = 1000
+    UNREACHED: t.ClassVar[int] = 2 ** 63 - 1
+
     @classmethod
     @abstractmethod
     def solve(
@@ -59,14 +78,113 @@ class PathFindingAlgorithm(ABC):
         return []
 
     @staticmethod
-    def _get_cost(from_node: Cell, to_node: Cell) -> float:
-        """Calculate the cost of moving from one node to another."""
-        prev_cost = 1
-        nudge = 0
-        x1, y1 = from_node
-        x2, y2 = to_node
-        if (x1 + y1) % 2 == 0 and x2 != x1:
-            nudge = 1
-        if (x1 + y1) % 2 == 1 and y2 != y1:
-            nudge = 1
-        return prev_cost + 0.001 * nudge
+    def _cell_id(grid: GridMatrix, cell: Cell) -> int:
+        """
+        Linearize a cell into an index of the flat per-cell arrays.
+
+        The arrays cover the grid plus a one-cell border, so every cell on
+        the grid has four addressable neighbors.
+        """
+        return (cell[0] + 1) * (grid.columns + 2) + cell[1] + 1
+
+    @staticmethod
+    def _walls(grid: GridMatrix) -> bytearray:
+        """
+        Return a flat map of blocked cells indexed by cell id, with the
+        border around the grid marked as blocked.
+        """
+        columns = grid.columns
+        width = columns + 2
+        cells = grid.to_bytes()
+        walls = bytearray(b'\x01') * (width * (grid.rows + 2))
+        for x in range(grid.rows):
+            offset = (x + 1) * width + 1
+            walls[offset:offset + columns] = (
+                cells[x * columns:(x + 1) * columns]
+            )
+        return walls
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _parities(grid_rows: int, grid_columns: int) -> bytes:
+        """
+        Return the parity of x + y for every cell id of a grid of the given
+        shape, so the solvers pick neighbor moves without unpacking ids.
+        """
+        width = grid_columns + 2
+        rows = (bytes([0, 1]) * width)[:width], (bytes([1, 0]) * width)[:width]
+        return b''.join(rows[x & 1] for x in range(grid_rows + 2))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2)
+    def _id_cells(
+            grid_rows: int,
+            grid_columns: int,
+    ) -> t.Tuple[t.Optional[Cell], ...]:
+        """
+        Return the cell of every cell id of a grid of the given shape, with
+        None on the border, so traces do not build a tuple per step.
+        """
+        width = grid_columns + 2
+        cells: t.List[t.Optional[Cell]] = [None] * (width * (grid_rows + 2))
+        for x in range(grid_rows):
+            offset = (x + 1) * width + 1
+            cells[offset:offset + grid_columns] = [
+                (x, y) for y in range(grid_columns)
+            ]
+        return tuple(cells)
+
+    @classmethod
+    @functools.lru_cache(maxsize=16)
+    def _neighbor_steps(
+            cls,
+            grid_columns: int,
+    ) -> t.Tuple[t.Tuple[t.Tuple[int, int], ...], ...]:
+        """
+        Build the moves to the neighbors of a cell, indexed by the parity of
+        its coordinates, as (id offset, cost) pairs listed in the same order
+        as GridMatrix.neighbors yields them.
+
+        Costs are integers in COST_SCALE units, so search keys can be packed
+        into plain ints. Tables depend only on the grid width and are
+        memoized.
+        """
+        width = grid_columns + 2
+        moves = ((1, 0), (-1, 0), (0, -1), (0, 1))
+        tables = []
+        for parity, order in ((0, moves[::-1]), (1, moves)):
+            cell = (parity, 0)
+            tables.append(tuple(
+                (
+                    dx * width + dy,
+                    round(cls.COST_SCALE * _get_cost(cell, (parity + dx, dy))),
+                )
+                for dx, dy in order
+            ))
+        return tuple(tables)
+
+    @staticmethod
+    def _reconstruct_path_ids(
+            grid: GridMatrix,
+            came_from: array,
+            source_id: int,
+            target_id: int,
+    ) -> t.List[Cell]:
+        """
+        Reconstruct the path from source to target using a flat came_from
+        array, where -1 marks cells that were never reached.
+        """
+        if came_from[target_id] == -1:
+            return []
+
+        width = grid.columns + 2
+        current = target_id
+        path: t.List[Cell] = []
+        while True:
+            x, y = divmod(current, width)
+            path.append((x - 1, y - 1))
+            if current == source_id:
+                break
+            current = came_from[current]
+        path.reverse()
+        return path
@@ -1,4 +1,4 @@
-from queue import Queue
+from array import array
 import typing as t
 
 from grid import GridMatrix, Cell
@@ -16,23 +16,34 @@ class BfsAlgorithm(PathFindingAlgorithm):
             target: Cell,
     ) -> t.List[Cell]:
         """Solve using BFS."""
-        frontier = Queue()
-        frontier.put(source)
+        walls = cls._walls(grid)
+        parities = cls._parities(grid.rows, grid.columns)
+        steps = cls._neighbor_steps(grid.columns)
+        source_id = cls._cell_id(grid, source)
+        target_id = cls._cell_id(grid, target)
 
-        came_from: t.Dict[Cell, t.Optional[Cell]] = dict()
-        came_from[source] = None
+        # Every cell is queued at most once, so the queue is a plain int
+        # array that is iterated while it grows and never drops entries.
+        frontier = array('i', [source_id])
+        enqueue = frontier.append
 
-        while not frontier.empty():
-            current = frontier.get()
-            if current == target:
+        visited = bytearray(len(walls))
+        came_from = array('i', [-1]) * len(walls)
+        visited[source_id] = 1
+        came_from[source_id] = source_id
+
+        for current_id in frontier:
+            if current_id == target_id:
                 break
 
-            for next_node in grid.neighbors(current):
-                if next_node not in came_from:
-                    frontier.put(next_node)
-                    came_from[next_node] = current
+            for offset, _ in steps[parities[current_id]]:
+                next_id = current_id + offset
+                if not walls[next_id] and not visited[next_id]:
+                    visited[next_id] = 1
+                    enqueue(next_id)
+                    came_from[next_id] = current_id
 
-        return cls.reconstruct_path(came_from, source, target)
+        return cls._reconstruct_path_ids(grid, came_from, source_id, target_id)
 
     @classmethod
     def solve_trace(
@@ -42,20 +53,32 @@ class BfsAlgorithm(PathFindingAlgorithm):
             target: Cell,
     ) -> t.Iterator[SolveStep]:
         """Yield steps for BFS visualization."""
-        frontier = Queue()
-        frontier.put(source)
+        walls = cls._walls(grid)
+        parities = cls._parities(grid.rows, grid.columns)
+        cells = cls._id_cells(grid.rows, grid.columns)
+        steps = cls._neighbor_steps(grid.columns)
+        source_id = cls._cell_id(grid, source)
+        target_id = cls._cell_id(grid, target)
+
+        frontier = array('i', [source_id])
+        enqueue = frontier.append
 
-        came_from: t.Dict[Cell, t.Optional[Cell]] = dict()
-        came_from[source] = None
+        visited = bytearray(len(walls))
+        visited[source_id] = 1
 
-        while not frontier.empty():
-            current = frontier.get()
-            if current == target:
+        for current_id in frontier:
+            if current_id == target_id:
                 break
 
-            for next_node in grid.neighbors(current):
-                yield SolveStep(selected_node=next_node, from_node=current)
+            current = cells[current_id]
+            for offset, _ in steps[parities[current_id]]:
+                next_id = current_id + offset
+                if walls[next_id]:
+                    continue
+
+                accepted = not visited[next_id]
+                yield SolveStep(cells[next_id], current, accepted)
 
-                if next_node not in came_from:
-                    frontier.put(next_node)
-                    came_from[next_node] = current
+                if accepted:
+                    visited[next_id] = 1
+                    enqueue(next_id)
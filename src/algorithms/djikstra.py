@@ -1,5 +1,6 @@
-from queue import PriorityQueue
+import heapq
 import typing as t
+from array import array
 
 from grid import GridMatrix, Cell
 from .base import SolveStep, PathFindingAlgorithm
@@ -15,35 +16,49 @@ class DijkstraAlgorithm(PathFindingAlgorithm):
             source: Cell,
             target: Cell,
     ) -> t.List[Cell]:
-        """Solve using Dijkstra's algorithm."""
-        frontier = PriorityQueue()
-        frontier.put((0, source))
-
-        came_from: t.Dict[Cell, t.Optional[Cell]] = dict()
-        cost_so_far: t.Dict[Cell, float] = dict()
-        came_from[source] = None
-        cost_so_far[source] = 0
-
-        while not frontier.empty():
-            _, current = frontier.get()
-
-            if current == target:
+        """
+        Solve using Dijkstra's algorithm.
+
+        Frontier entries are packed into single ints, cost * size + id, which
+        heapq compares much faster than tuples. Entries left behind by a later
+        improvement are skipped when popped.
+        """
+        walls = cls._walls(grid)
+        parities = cls._parities(grid.rows, grid.columns)
+        steps = cls._neighbor_steps(grid.columns)
+        source_id = cls._cell_id(grid, source)
+        target_id = cls._cell_id(grid, target)
+
+        size = len(walls)
+        frontier: t.List[int] = [source_id]
+        push, pop = heapq.heappush, heapq.heappop
+
+        came_from = array('i', [-1]) * size
+        cost_so_far = array('q', [cls.UNREACHED]) * size
+        came_from[source_id] = source_id
+        cost_so_far[source_id] = 0
+
+        while frontier:
+            current_cost, current_id = divmod(pop(frontier), size)
+            if current_cost != cost_so_far[current_id]:
+                continue
+
+            if current_id == target_id:
                 break
 
-            for next_node in grid.neighbors(current):
-                next_cost = cls._get_cost(current, next_node)
-                new_cost = cost_so_far[current] + next_cost
+            for offset, next_cost in steps[parities[current_id]]:
+                next_id = current_id + offset
+                if walls[next_id]:
+                    continue
 
-                if (
-                        next_node not in cost_so_far or
-                        new_cost < cost_so_far[next_node]
-                ):
-                    cost_so_far[next_node] = new_cost
+                new_cost = current_cost + next_cost
+                if new_cost < cost_so_far[next_id]:
+                    cost_so_far[next_id] = new_cost
                     priority = new_cost
-                    frontier.put((priority, next_node))
-                    came_from[next_node] = current
+                    push(frontier, priority * size + next_id)
+                    came_from[next_id] = current_id
 
-        return cls.reconstruct_path(came_from, source, target)
+        return cls._reconstruct_path_ids(grid, came_from, source_id, target_id)
 
     @classmethod
     def solve_trace(
@@ -53,31 +68,39 @@ class DijkstraAlgorithm(PathFindingAlgorithm):
             target: Cell,
     ) -> t.Iterator[SolveStep]:
         """Yield steps for Dijkstra visualization."""
-        frontier = PriorityQueue()
-        frontier.put((0, source))
-
-        came_from: t.Dict[Cell, t.Optional[Cell]] = {}
-        cost_so_far: t.Dict[Cell, float] = {}
-
-        came_from[source] = None
-        cost_so_far[source] = 0
-
-        while not frontier.empty():
-            _, current = frontier.get()
-            if current == target:
+        walls = cls._walls(grid)
+        parities = cls._parities(grid.rows, grid.columns)
+        cells = cls._id_cells(grid.rows, grid.columns)
+        steps = cls._neighbor_steps(grid.columns)
+        source_id = cls._cell_id(grid, source)
+        target_id = cls._cell_id(grid, target)
+
+        size = len(walls)
+        frontier: t.List[int] = [source_id]
+        push, pop = heapq.heappush, heapq.heappop
+
+        cost_so_far = array('q', [cls.UNREACHED]) * size
+        cost_so_far[source_id] = 0
+
+        while frontier:
+            current_cost, current_id = divmod(pop(frontier), size)
+            if current_cost != cost_so_far[current_id]:
+                continue
+
+            if current_id == target_id:
                 break
 
-            for next_node in grid.neighbors(current):
-                next_cost = cls._get_cost(current, next_node)
-                new_cost = cost_so_far[current] + next_cost
+            current = cells[current_id]
+            for offset, next_cost in steps[parities[current_id]]:
+                next_id = current_id + offset
+                if walls[next_id]:
+                    continue
 
-                yield SolveStep(selected_node=next_node, from_node=current)
+                new_cost = current_cost + next_cost
+                accepted = new_cost < cost_so_far[next_id]
+                yield SolveStep(cells[next_id], current, accepted)
 
-                if (
-                        next_node not in cost_so_far or
-                        new_cost < cost_so_far[next_node]
-                ):
-                    cost_so_far[next_node] = new_cost
+                if accepted:
+                    cost_so_far[next_id] = new_cost
                     priority = new_cost
-                    frontier.put((priority, next_node))
-                    came_from[next_node] = current
+                    push(frontier, priority * size + next_id)
@@ -9,13 +9,16 @@ class GridMatrix:
     MIN_ROWS: t.ClassVar[int] = 10
     MIN_COLUMNS: t.ClassVar[int] = 10
 
+    _NB_ODD: t.ClassVar[t.Tuple[Cell, ...]] = (
+        (1, 0), (-1, 0), (0, -1), (0, 1),
+    )
+    _NB_EVEN: t.ClassVar[t.Tuple[Cell, ...]] = _NB_ODD[::-1]
+
     def __init__(self, rows: int, columns: int, preset: bool = False):
         """."""
         self._rows = rows
         self._columns = columns
-        self._cells: t.List[t.List[bool]] = [
-            [preset for _ in range(columns)] for _ in range(rows)
-        ]
+        self._cells = bytearray([preset]) * (rows * columns)
 
     @property
     def rows(self) -> int:
@@ -25,6 +28,10 @@ class GridMatrix:
     def columns(self) -> int:
         return self._columns
 
+    def to_bytes(self) -> bytes:
+        """Return the cells in row-major order, one byte (0 or 1) each."""
+        return bytes(self._cells)
+
     def is_on_grid(self, node: Cell) -> bool:
         """Check if a node is within the grid boundaries."""
         x, y = node
@@ -38,26 +45,26 @@ class GridMatrix:
     def neighbors(self, cell: Cell) -> t.Iterator[Cell]:
         """Return an iterator over walkable neighbors of a given cell."""
         x, y = cell
-        neighbors = [(x + 1, y), (x - 1, y), (x, y - 1), (x, y + 1)]
-        if (x + y) % 2 == 0:
-            neighbors.reverse()
-        results = filter(self.in_bounds, neighbors)
-        results = filter(lambda c: not self.get_cell(c), results)
-        return results
+        rows, columns, cells = self._rows, self._columns, self._cells
+        for dx, dy in self._NB_EVEN if (x + y) % 2 == 0 else self._NB_ODD:
+            nx, ny = x + dx, y + dy
+            if (
+                    0 <= nx < rows and 0 <= ny < columns and
+                    not cells[nx * columns + ny]
+            ):
+                yield nx, ny
 
     def try_resize(self, rows: int, columns: int) -> bool:
         """Resize the grid if new dimensions are at least 10x10."""
         if rows >= self.MIN_ROWS and columns >= self.MIN_COLUMNS:
             old_cells = self._cells
-            self._cells = [
-                [
-                    old_cells[j][i]
-                    if (j < self._rows and i < self._columns)
-                    else False
-                    for i in range(columns)
-                ]
-                for j in range(rows)
-            ]
+            self._cells = bytearray(rows * columns)
+            kept_columns = min(columns, self._columns)
+            for j in range(min(rows, self._rows)):
+                old_offset = j * self._columns
+                self._cells[j * columns:j * columns + kept_columns] = (
+                    old_cells[old_offset:old_offset + kept_columns]
+                )
             self._rows = rows
             self._columns = columns
             return True
@@ -66,19 +73,19 @@ class GridMatrix:
     def try_set_cell(self, cell: Cell) -> bool:
         """Set a cell as occupied if it's within bounds."""
         if self.in_bounds(cell):
-            self._cells[cell[0]][cell[1]] = True
+            self._cells[cell[0] * self._columns + cell[1]] = True
             return True
         return False
 
     def try_reset_cell(self, cell: Cell) -> bool:
         """Reset a cell to free if it's within bounds."""
         if self.in_bounds(cell):
-            self._cells[cell[0]][cell[1]] = False
+            self._cells[cell[0] * self._columns + cell[1]] = False
             return True
         return False
 
     def get_cell(self, cell: Cell) -> bool:
         """Get the state of a cell (True if occupied)."""
         if self.in_bounds(cell):
-            return self._cells[cell[0]][cell[1]]
+            return bool(self._cells[cell[0] * self._columns + cell[1]])
         return False
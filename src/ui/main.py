@@ -1,5 +1,5 @@
 import typing as t
-from math import floor
+from bisect import bisect_left
 
 import PyQt5.QtCore as QtCore
 import PyQt5.QtWidgets as QtWidgets
@@ -22,14 +22,43 @@ from .solver import SolverGridWidget, SolverStateType, DrawMode
 class MainWindow(QtWidgets.QMainWindow):
     """Main application window for the pathfinding visualizer."""
 
+    # Grid size and animation interval for each position of the 0..99
+    # sliders.
+    _SLIDER_SIZES: t.ClassVar[t.Tuple[int, ...]] = tuple(
+        value * 90 // 100 + 10 for value in range(100)
+    )
+    _SLIDER_INTERVALS: t.ClassVar[t.Tuple[int, ...]] = tuple(
+        value * 990 // 100 + 10 for value in range(100)
+    )
+    # Name and algorithm of each algorithm combo box entry.
+    _ALGORITHMS: t.ClassVar[
+        t.Tuple[t.Tuple[str, t.Type[PathFindingAlgorithm]], ...]
+    ] = (
+        ("A*", AStarAlgorithm),
+        ("Dijkstra Search", DijkstraAlgorithm),
+        ("Breadth-first Search", BfsAlgorithm),
+    )
+    # Draw mode for each draw mode combo box entry.
+    _DRAW_MODES: t.ClassVar[t.Tuple[DrawMode, ...]] = (
+        DrawMode.walls,
+        DrawMode.target,
+        DrawMode.source,
+    )
+    # Start button text and editing availability for each solver state
+    # the window reacts to; None leaves the editing widgets as they are.
+    _STATE_ACTIONS: t.ClassVar[
+        t.Dict[SolverStateType, t.Tuple[str, t.Optional[bool]]]
+    ] = {
+        SolverStateType.solving: ("Skip", False),
+        SolverStateType.solved: ("Finish", None),
+        SolverStateType.viewing: ("Start", True),
+    }
+
     def __init__(self):
         """."""
         super().__init__()
-        self.algorithms: t.Dict[str, t.Type[PathFindingAlgorithm]] = {
-            "A*": AStarAlgorithm,
-            "Dijkstra Search": DijkstraAlgorithm,
-            "Breadth-first Search": BfsAlgorithm,
-        }
+        self._algorithm_instances: t.Dict[int, PathFindingAlgorithm] = {}
+        self._error_box: t.Optional[QtWidgets.QMessageBox] = None
 
         self.setObjectName("MainWindow")
         self.setMinimumSize(824, 624)
@@ -56,59 +85,72 @@ class MainWindow(QtWidgets.QMainWindow):
         self.vertical_layout.setObjectName("verticalLayout")
 
         self._setup_settings_group_box()
-        self._setup_algorithm_group_box()
+        self.horizontal_layout.addWidget(self.vertical_layout_widget)
 
         self.grid_widget = SolverGridWidget(50, 50, self.centralwidget)
         self.grid_widget.setObjectName("gridSolver")
 
-        self.row_label.setText(f"Number of rows: {self.grid_widget.grid.rows}")
-        self.column_label.setText(
-            f"Number of columns: {self.grid_widget.grid.columns}",
-        )
+        self._update_size_labels()
+
+        # Slider drags emit a value per tick; only the last one is applied.
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(40)
+        self._resize_timer.timeout.connect(self._resize_grid)
 
-        self.row_slider.valueChanged.connect(self._resize_grid)
-        self.column_slider.valueChanged.connect(self._resize_grid)
+        self.row_slider.valueChanged.connect(self._schedule_resize)
+        self.column_slider.valueChanged.connect(self._schedule_resize)
 
         self.horizontal_layout.addWidget(self.grid_widget)
 
         self.grid_layout.addLayout(self.horizontal_layout, 0, 0, 1, 1)
         self.setCentralWidget(self.centralwidget)
-        QtCore.QMetaObject.connectSlotsByName(self)
+
+        self._edit_enabled = True
+        self._edit_widgets: t.Tuple[QtWidgets.QWidget, ...] = ()
 
         self.grid_widget.add_state_callback(self._on_state_changed)
 
-    def _disable_grid_editing(self):
-        """Disable UI elements related to grid editing."""
-        self.row_slider.setEnabled(False)
-        self.column_slider.setEnabled(False)
-        self.random_walls_button.setEnabled(False)
-        self.draw_mode_combo_box.setEnabled(False)
-        self.algorithm_combo_box.setEnabled(False)
-        self.interval_slider.setEnabled(False)
-        self.filepicker_load_button.setEnabled(False)
-        self.filepicker_save_button.setEnabled(False)
-
-    def _enable_grid_editing(self):
-        """Enable UI elements related to grid editing."""
-        self.row_slider.setEnabled(True)
-        self.column_slider.setEnabled(True)
-        self.random_walls_button.setEnabled(True)
-        self.draw_mode_combo_box.setEnabled(True)
-        self.algorithm_combo_box.setEnabled(True)
-        self.interval_slider.setEnabled(True)
-        self.filepicker_load_button.setEnabled(True)
-        self.filepicker_save_button.setEnabled(True)
+        # The file and algorithm panels are not needed to show the grid,
+        # so they are built once the event loop is idle.
+        QtCore.QTimer.singleShot(0, self._finalize_ui)
+
+    def _finalize_ui(self):
+        """Build the deferred group boxes and sync them with the solver."""
+        self._setup_file_group_box()
+        self._setup_algorithm_group_box()
+
+        self._edit_widgets = (
+            self.row_slider,
+            self.column_slider,
+            self.random_walls_button,
+            self.draw_mode_combo_box,
+            self.algorithm_combo_box,
+            self.interval_slider,
+            self.filepicker_load_button,
+            self.filepicker_save_button,
+        )
+        self._on_state_changed()
+
+    def _set_grid_editing(self, enabled: bool):
+        """Enable or disable UI elements related to grid editing."""
+        if enabled == self._edit_enabled:
+            return
+
+        self._edit_enabled = enabled
+        for widget in self._edit_widgets:
+            widget.setEnabled(enabled)
 
     def _on_state_changed(self):
         """Handle changes in the solver's state."""
-        if self.grid_widget.state == SolverStateType.solving:
-            self.start_button.setText("Skip")
-            self._disable_grid_editing()
-        elif self.grid_widget.state == SolverStateType.solved:
-            self.start_button.setText("Finish")
-        elif self.grid_widget.state == SolverStateType.viewing:
-            self.start_button.setText("Start")
-            self._enable_grid_editing()
+        action = self._STATE_ACTIONS.get(self.grid_widget.state)
+        if action is None or not self._edit_widgets:
+            return
+
+        text, editing = action
+        self.start_button.setText(text)
+        if editing is not None:
+            self._set_grid_editing(editing)
 
     def _process_start_button(self):
         """Handle the start button click based on current state."""
@@ -117,70 +159,65 @@ class MainWindow(QtWidgets.QMainWindow):
         elif self.grid_widget.state == SolverStateType.solved:
             self.grid_widget.state = SolverStateType.viewing
         elif self.grid_widget.state == SolverStateType.viewing:
+            if self._resize_timer.isActive():
+                self._resize_timer.stop()
+                self._resize_grid()
             self.grid_widget.start_solving()
 
+    def _schedule_resize(self):
+        """Restart the resize timer so a slider drag resizes the grid once."""
+        self._resize_timer.start()
+
     def _resize_grid(self):
         """Resize the grid based on slider values."""
-        new_rows = floor(self.row_slider.value() / 100 * 90) + 10
-        new_cols = floor(self.column_slider.value() / 100 * 90) + 10
-        self.grid_widget.resize_grid(new_rows, new_cols)
+        new_rows = self._SLIDER_SIZES[self.row_slider.value()]
+        new_cols = self._SLIDER_SIZES[self.column_slider.value()]
+        grid = self.grid_widget.grid
+        if (new_rows, new_cols) != (grid.rows, grid.columns):
+            self.grid_widget.resize_grid(new_rows, new_cols)
 
-        self.row_label.setText(
-            f"Number of rows: {self.grid_widget.grid.rows}",
-        )
-        self.column_label.setText(
-            f"Number of columns: {self.grid_widget.grid.columns}",
-        )
+        self._update_size_labels()
+
+    def _update_size_labels(self):
+        """Show the current grid size in the size group box labels."""
+        rows_text = f"Number of rows: {self.grid_widget.grid.rows}"
+        if self.row_label.text() != rows_text:
+            self.row_label.setText(rows_text)
+
+        columns_text = f"Number of columns: {self.grid_widget.grid.columns}"
+        if self.column_label.text() != columns_text:
+            self.column_label.setText(columns_text)
 
     def _generate_random_grid(self):
         """Generate a random maze in the grid."""
-        self.grid_widget.grid = DfsMazeGenerator.generate(
+        grid = DfsMazeGenerator.generate(
             self.grid_widget.grid.rows, self.grid_widget.grid.columns
         )
-
-        if self.grid_widget.grid.get_cell(self.grid_widget.model.target):
-            self.grid_widget.grid.try_reset_cell(
-                cell=self.grid_widget.model.target,
-            )
-
-        if self.grid_widget.grid.get_cell(self.grid_widget.model.source):
-            self.grid_widget.grid.try_reset_cell(
-                cell=self.grid_widget.model.source,
-            )
+        grid.try_reset_cell(self.grid_widget.model.target)
+        grid.try_reset_cell(self.grid_widget.model.source)
+        self.grid_widget.grid = grid
 
         self.grid_widget.invalidate_cache()
-        self.update()
-
-    def _set_walls_draw_mode(self):
-        """Set the draw mode to walls."""
-        self.grid_widget.draw_mode = DrawMode.walls
-
-    def _set_target_draw_mode(self):
-        """Set the draw mode to target."""
-        self.grid_widget.draw_mode = DrawMode.target
-
-    def _set_source_draw_mode(self):
-        """Set the draw mode to source."""
-        self.grid_widget.draw_mode = DrawMode.source
+        self.grid_widget.update()
 
     def _draw_mode_change_handler(self):
         """Handle changes in the draw mode combo box."""
-        commands = [
-            self._set_walls_draw_mode,
-            self._set_target_draw_mode,
-            self._set_source_draw_mode,
+        self.grid_widget.draw_mode = self._DRAW_MODES[
+            self.draw_mode_combo_box.currentIndex()
         ]
-        commands[self.draw_mode_combo_box.currentIndex()]()
 
     def _algorithm_change_handler(self):
         """Handle changes in the algorithm combo box."""
-        self.grid_widget.set_algorithm(
-            self.algorithms[self.algorithm_combo_box.currentText()](),
-        )
+        index = self.algorithm_combo_box.currentIndex()
+        algorithm = self._algorithm_instances.get(index)
+        if algorithm is None:
+            _, algorithm_type = self._ALGORITHMS[index]
+            algorithm = self._algorithm_instances[index] = algorithm_type()
+        self.grid_widget.set_algorithm(algorithm)
 
     def _change_interval(self):
         """Change the animation interval based on the slider."""
-        new_interval = floor(self.interval_slider.value() / 100 * 990) + 10
+        new_interval = self._SLIDER_INTERVALS[self.interval_slider.value()]
         self.grid_widget.interval = new_interval
 
     def _save_file(self):
@@ -195,12 +232,7 @@ class MainWindow(QtWidgets.QMainWindow):
             try:
                 saver.save()
             except GridFileException as e:
-                message_box = QtWidgets.QMessageBox()
-                message_box.setIcon(QtWidgets.QMessageBox.Warning)
-                message_box.setText("Error saving file!")
-                message_box.setInformativeText(str(e))
-                message_box.setWindowTitle("Error!")
-                message_box.exec()
+                self._show_error("Error saving file!", str(e))
 
     def _load_file(self):
         """Load a grid from a file."""
@@ -221,22 +253,40 @@ class MainWindow(QtWidgets.QMainWindow):
                     loaded_grid.columns,
                 )
                 self.grid_widget.invalidate_cache()  # Обновляем кэш сетки
-                self.update()
-
-                self.row_slider.setValue(
-                    int(floor(10 * loaded_grid.rows - 100) / 9),
-                )
-                self.column_slider.setValue(
-                    int(floor(10 * loaded_grid.columns - 100) / 9),
-                )
+                self.grid_widget.update()
+
+                # Moving the sliders must not resize the loaded grid again.
+                self._resize_timer.stop()
+                with QtCore.QSignalBlocker(self.row_slider), \
+                        QtCore.QSignalBlocker(self.column_slider):
+                    self.row_slider.setValue(
+                        self._size_slider_value(loaded_grid.rows),
+                    )
+                    self.column_slider.setValue(
+                        self._size_slider_value(loaded_grid.columns),
+                    )
+                self._update_size_labels()
 
             except GridFileException as e:
-                message_box = QtWidgets.QMessageBox(file_dialog)
-                message_box.setIcon(QtWidgets.QMessageBox.Warning)
-                message_box.setText("Error loading file!")
-                message_box.setInformativeText(str(e))
-                message_box.setWindowTitle("Error!")
-                message_box.exec()
+                self._show_error("Error loading file!", str(e))
+
+    def _show_error(self, text: str, details: str):
+        """Show a warning message box, creating it on first use."""
+        if self._error_box is None:
+            self._error_box = QtWidgets.QMessageBox(self)
+            self._error_box.setIcon(QtWidgets.QMessageBox.Warning)
+            self._error_box.setWindowTitle("Error!")
+
+        self._error_box.setText(text)
+        self._error_box.setInformativeText(details)
+        self._error_box.exec()
+
+    def _size_slider_value(self, size: int) -> int:
+        """Return the first size slider position that gives at least size."""
+        return min(
+            bisect_left(self._SLIDER_SIZES, size),
+            len(self._SLIDER_SIZES) - 1,
+        )
 
     def _setup_file_group_box(self):
         """Setup the file operations group box."""
@@ -254,7 +304,7 @@ class MainWindow(QtWidgets.QMainWindow):
         )
 
         layout = QtWidgets.QVBoxLayout(self.filepicker_layout_widget)
-        self.settings_layout.addWidget(self.filepicker_group_box)
+        self.settings_layout.insertWidget(0, self.filepicker_group_box)
 
         self.filepicker_load_button = QtWidgets.QPushButton()
         self.filepicker_load_button.setObjectName("filepickerLoadButton")
@@ -363,7 +413,6 @@ class MainWindow(QtWidgets.QMainWindow):
         self.settings_layout.setContentsMargins(8, 8, 8, 8)
         self.vertical_layout.addWidget(self.settings_group_box)
 
-        self._setup_file_group_box()
         self._setup_grid_size_group_box()
         self._setup_maze_generation_group_box()
         self._setup_paint_group_box()
@@ -421,10 +470,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.algorithm_combo_box = QtWidgets.QComboBox(
             self.algorithm_layout_widget,
         )
-
-        for name in self.algorithms.keys():
-            self.algorithm_combo_box.addItem(name)
-
+        self.algorithm_combo_box.addItems(
+            [name for name, _ in self._ALGORITHMS],
+        )
         self.algorithm_combo_box.setObjectName("algorithmComboBox")
         self.algorithm_combo_box.currentIndexChanged.connect(
             self._algorithm_change_handler,
@@ -450,4 +498,3 @@ class MainWindow(QtWidgets.QMainWindow):
         self.algorithm_layout.addWidget(self.start_button)
 
         self.vertical_layout.addWidget(self.algorithm_group_box)
-        self.horizontal_layout.addWidget(self.vertical_layout_widget)
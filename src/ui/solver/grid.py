@@ -1,11 +1,20 @@
+import typing as t
+from math import ceil, floor
+
 from PyQt5 import QtGui, QtCore, QtWidgets
 
-from grid import GridMatrix
+from grid import Cell, GridMatrix
 
 
 class GridWidget(QtWidgets.QWidget):
     """Widget that displays a grid of walls."""
 
+    # Wall image palette indexed by cell byte: free cells are transparent.
+    _WALL_COLOR_TABLE: t.ClassVar[t.List[int]] = [
+        QtGui.qRgba(0, 0, 0, 0),
+        QtGui.qRgb(32, 32, 32),
+    ]
+
     def __init__(self, rows: int, columns: int, *args, **kwargs):
         """."""
         super().__init__(*args, **kwargs)
@@ -20,6 +29,8 @@ class GridWidget(QtWidgets.QWidget):
         self._canvas_height: int = 0
         self._canvas_left: int = 0
         self._canvas_top: int = 0
+        self._row_offsets: t.Tuple[float, ...] = ()
+        self._column_offsets: t.Tuple[float, ...] = ()
         self._update_layout()
 
     def resizeEvent(self, event: QtGui.QResizeEvent):
@@ -29,11 +40,10 @@ class GridWidget(QtWidgets.QWidget):
 
     def paintEvent(self, event: QtGui.QPaintEvent):
         """Paint the cached grid pixmap."""
-        self._render_grid_pixmap()
+        if self._grid_dirty:
+            self._render_grid_pixmap()
 
         painter = QtGui.QPainter(self)
-        painter.translate(0.5, 0.5)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
 
         painter.drawPixmap(
             self._canvas_left,
@@ -52,6 +62,43 @@ class GridWidget(QtWidgets.QWidget):
         """Mark the grid cache as invalid."""
         self._grid_dirty = True
 
+    def invalidate_cells(self, cells: t.Sequence[Cell]):
+        """
+        Redraw only the given cells of the grid cache.
+
+        Falls back to a full render when the cache is already invalid.
+        """
+        if self._grid_dirty or self._grid_pixmap.isNull():
+            self._grid_dirty = True
+            return
+
+        area = self._cells_canvas_rect(cells)
+        if area.isEmpty():
+            return
+
+        painter = QtGui.QPainter(self._grid_pixmap)
+        painter.setClipRect(area)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+        painter.fillRect(area, QtCore.Qt.transparent)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+        self._draw_grid_lines_cached(painter)
+        self._draw_walls_cached(painter)
+        painter.end()
+
+    def _cells_canvas_rect(self, cells: t.Sequence[Cell]) -> QtCore.QRect:
+        """Get the canvas area covering the given cells, outlines included."""
+        rows = [row for row, _ in cells]
+        if not rows:
+            return QtCore.QRect()
+
+        columns = [column for _, column in cells]
+        size = self._square_size
+        left = floor(min(columns) * size) - 1
+        top = floor(min(rows) * size) - 1
+        right = ceil((max(columns) + 1) * size) + 1
+        bottom = ceil((max(rows) + 1) * size) + 1
+        return QtCore.QRect(left, top, right - left + 1, bottom - top + 1)
+
     def _update_layout(self):
         """
         Recalculate canvas size and position based on current widget size.
@@ -66,19 +113,21 @@ class GridWidget(QtWidgets.QWidget):
         self._canvas_height = round(self._square_size * self.grid.rows)
         self._canvas_left = round((self.width() - self._canvas_width) / 2)
         self._canvas_top = round((self.height() - self._canvas_height) / 2)
+        # Canvas offsets of every row and column, for cell to rect lookups.
+        self._row_offsets = tuple(
+            row * self._square_size for row in range(self.grid.rows)
+        )
+        self._column_offsets = tuple(
+            column * self._square_size for column in range(self.grid.columns)
+        )
         self._grid_dirty = True
 
     def _render_grid_pixmap(self):
         """Render the grid to a pixmap for caching."""
-        if not self._grid_dirty:
-            return
-
         pixmap = QtGui.QPixmap(self._canvas_width, self._canvas_height)
         pixmap.fill(QtCore.Qt.transparent)
 
         painter = QtGui.QPainter(pixmap)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
-
         self._draw_grid_lines_cached(painter)
         self._draw_walls_cached(painter)
 
@@ -89,26 +138,40 @@ class GridWidget(QtWidgets.QWidget):
 
     def _draw_grid_lines_cached(self, painter: QtGui.QPainter):
         """Draw grid lines on a cached pixmap."""
+        size = self._square_size
+        width, height = self._canvas_width, self._canvas_height
         painter.setOpacity(0.1)
         y = 0
         for _ in range(self.grid.rows + 1):
-            painter.drawLine(0, int(y), self._canvas_width, int(y))
-            y += self._square_size
+            painter.drawLine(0, int(y), width, int(y))
+            y += size
 
         x = 0
         for _ in range(self.grid.columns + 1):
-            painter.drawLine(int(x), 0, int(x), self._canvas_height)
-            x += self._square_size
+            painter.drawLine(int(x), 0, int(x), height)
+            x += size
 
     def _draw_walls_cached(self, painter: QtGui.QPainter):
-        """Draw walls on a cached pixmap."""
-        wall_rect = QtCore.QRectF(0, 0, self._square_size, self._square_size)
+        """
+        Draw walls on a cached pixmap.
+
+        The cell bytes become an indexed image with one pixel per cell, which
+        is scaled onto the canvas in a single blit.
+        """
+        rows, columns = self.grid.rows, self.grid.columns
+        image = QtGui.QImage(
+            self.grid.to_bytes(),
+            columns,
+            rows,
+            columns,
+            QtGui.QImage.Format_Indexed8,
+        )
+        image.setColorTable(self._WALL_COLOR_TABLE)
+
         painter.setOpacity(1)
-        painter.setBrush(QtGui.QColor(32, 32, 32))
-
-        for row in range(self.grid.rows):
-            for column in range(self.grid.columns):
-                if self.grid.get_cell((row, column)):
-                    x = column * self._square_size
-                    y = row * self._square_size
-                    painter.drawRect(wall_rect.translated(x, y))
+        painter.drawImage(
+            QtCore.QRectF(
+                0, 0, columns * self._square_size, rows * self._square_size,
+            ),
+            image,
+        )
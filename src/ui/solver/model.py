@@ -1,5 +1,6 @@
 import enum
 import typing as t
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 from algorithms import PathFindingAlgorithm, AStarAlgorithm, SolveStep
@@ -20,11 +21,24 @@ class SolverModel:
     target: Cell
     algorithm: PathFindingAlgorithm = AStarAlgorithm()
 
-    _used: t.Set[Cell] = field(default_factory=set)
+    # Number of solved paths kept in the solve cache.
+    SOLVE_CACHE_SIZE: t.ClassVar[int] = 32
+
+    # Row-major visited flags, one byte per grid cell.
+    _used_mask: bytearray = field(default_factory=bytearray)
+    _used_order: t.List[Cell] = field(default_factory=list)
     _full_path: t.Dict[Cell, t.Optional[Cell]] = field(default_factory=dict)
     _current_cell: t.Optional[Cell] = None
     _current_path_cache: t.List[Cell] = field(default_factory=list)
+    _current_path_index: t.Dict[Cell, int] = field(default_factory=dict)
     _observers: t.List[t.Callable] = field(default_factory=list)
+    _solve_cache: t.OrderedDict[t.Hashable, t.List[Cell]] = field(
+        default_factory=OrderedDict,
+    )
+
+    def __post_init__(self):
+        """Allocate the visited mask for the grid."""
+        self._used_mask = bytearray(self.grid.rows * self.grid.columns)
 
     def add_observer(self, callback: t.Callable):
         """Add a callback to be called when the model state changes."""
@@ -41,28 +55,100 @@ class SolverModel:
 
     def reset(self):
         """Reset the solving state (used cells, path, current cell, etc.)."""
-        self._used.clear()
+        self._used_mask = bytearray(self.grid.rows * self.grid.columns)
+        self._used_order.clear()
         self._full_path.clear()
         self._current_cell = None
         self._current_path_cache.clear()
+        self._current_path_index.clear()
         self.notify_observers()
 
     def apply_step(self, step: SolveStep):
         """
         Apply a single step from the algorithm trace to update the model state.
         """
-        if step.selected_node not in self._full_path:
-            self._full_path[step.selected_node] = step.from_node
-            self._used.add(step.selected_node)
-        self._current_cell = step.selected_node
-        self._current_path_cache.clear()
+        self.apply_steps((step,))
+
+    def apply_steps(self, steps: t.Iterable[SolveStep]):
+        """Apply a batch of trace steps, notifying observers once."""
+        columns = self.grid.columns
+        full_path = self._full_path
+        used_mask = self._used_mask
+        append_used = self._used_order.append
+        current_cell = self._current_cell
+        for current_cell, from_node, accepted in steps:
+            if accepted:
+                if current_cell in full_path:
+                    # A cell got a new parent, which may reroute cached
+                    # paths.
+                    self._current_path_cache.clear()
+                    self._current_path_index.clear()
+                full_path[current_cell] = from_node
+                row, column = current_cell
+                cell_id = row * columns + column
+                if not used_mask[cell_id]:
+                    used_mask[cell_id] = 1
+                    append_used(current_cell)
+        self._current_cell = current_cell
         self.notify_observers()
 
+    def solve(self) -> t.List[Cell]:
+        """Solve from source to target, reusing a cached path if any."""
+        path = self.get_cached_path()
+        if path is None:
+            path = self.algorithm.solve(
+                grid=self.grid,
+                source=self.source,
+                target=self.target,
+            )
+            self.cache_path(path)
+        return path
+
+    def get_cached_path(self) -> t.Optional[t.List[Cell]]:
+        """
+        Get the cached path for the current grid, source, target and
+        algorithm type, or None if it has not been solved yet.
+        """
+        key = self._solve_key()
+        path = self._solve_cache.get(key)
+        if path is not None:
+            self._solve_cache.move_to_end(key)
+        return path
+
+    def cache_path(self, path: t.List[Cell]):
+        """
+        Remember a path found for the current grid, source, target and
+        algorithm type. Empty results are not cached.
+        """
+        if not path:
+            return
+
+        key = self._solve_key()
+        self._solve_cache[key] = path
+        self._solve_cache.move_to_end(key)
+        if len(self._solve_cache) > self.SOLVE_CACHE_SIZE:
+            self._solve_cache.popitem(last=False)
+
+    def _solve_key(self) -> t.Hashable:
+        """Get the solve cache key for the current problem."""
+        return (
+            type(self.algorithm),
+            self.grid.rows,
+            self.grid.columns,
+            self.grid.to_bytes(),
+            self.source,
+            self.target,
+        )
+
     def get_used_cells(self) -> t.Set[Cell]:
         """
         Get the set of cells that have been visited during the solving process.
         """
-        return self._used
+        return set(self._used_order)
+
+    def get_used_order(self) -> t.List[Cell]:
+        """Get the visited cells in the order they were first reached."""
+        return self._used_order
 
     def get_full_path(self) -> t.Dict[Cell, t.Optional[Cell]]:
         """Get the full path map (came_from dictionary) built so far."""
@@ -75,15 +161,37 @@ class SolverModel:
     def get_current_path_cache(self) -> t.List[Cell]:
         """
         Get the reconstructed path from source to the current cell.
-        The path is cached to avoid repeated reconstruction.
+
+        The path is cached and updated incrementally: only the cells between
+        the current cell and the nearest cell already on the cached path are
+        walked, which between consecutive steps is usually one or two.
         """
-        if not self._current_path_cache and self._current_cell:
-            self._current_path_cache = self.algorithm.reconstruct_path(
-                came_from=self._full_path,
-                source=self.source,
-                target=self._current_cell,
-            )
-        return self._current_path_cache
+        if self._current_cell not in self._full_path:
+            return []
+
+        path = self._current_path_cache
+        index = self._current_path_index
+        if not path:
+            path.append(self.source)
+            index[self.source] = 0
+
+        tail: t.List[Cell] = []
+        cell = self._current_cell
+        position = index.get(cell)
+        while (
+                position is None
+                or position >= len(path)
+                or path[position] != cell
+        ):
+            tail.append(cell)
+            cell = self._full_path[cell]
+            position = index.get(cell)
+
+        del path[position + 1:]
+        for cell in reversed(tail):
+            index[cell] = len(path)
+            path.append(cell)
+        return path
 
 
 class DrawMode(enum.Enum):
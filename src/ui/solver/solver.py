@@ -1,4 +1,5 @@
 import colorsys
+import functools
 import typing as t
 from math import floor
 
@@ -7,10 +8,11 @@ import PyQt5.QtGui as QtGui
 import PyQt5.QtWidgets as QtWidgets
 
 from algorithms import PathFindingAlgorithm, AStarAlgorithm, SolveStep
-from grid import Cell
+from grid import GridMatrix, Cell
 from .grid import GridWidget
 from .model import SolverModel, DrawMode
 from .state import (
+    SolverState,
     SolverStateType,
     ViewingState,
     DrawingState,
@@ -18,7 +20,20 @@ from .state import (
     SolvingState,
     SolvedState,
 )
-from .thread import SolverThread
+from .thread import SolverThread, SolveWorker, SettingsWriter
+
+# State objects keep no per-widget data, so one instance of each is shared.
+_STATE_OBJECTS: t.Dict[SolverStateType, SolverState] = {
+    SolverStateType.viewing: ViewingState(),
+    SolverStateType.drawing: DrawingState(),
+    SolverStateType.erasing: ErasingState(),
+    SolverStateType.solving: SolvingState(),
+    SolverStateType.solved: SolvedState(),
+}
+
+# Shared by every solver widget for reading settings; writes go through
+# each widget's SettingsWriter thread.
+_SETTINGS = QtCore.QSettings('Labyrinth', 'SolverGridWidget')
 
 
 class SolverGridWidget(GridWidget):
@@ -26,69 +41,224 @@ class SolverGridWidget(GridWidget):
     Widget that displays a grid of walls and visualizes pathfinding algorithms.
     """
 
+    # Minimum time between applying mouse edits, about one frame.
+    _MOUSE_INTERVAL_MS: t.ClassVar[int] = 16
+    # Quiet period after the last interval change before it is saved.
+    _SETTINGS_DELAY_MS: t.ClassVar[int] = 1_000
+
     _used_brush = QtGui.QBrush(QtGui.QColor(128, 128, 128))
     _source_brush = QtGui.QBrush(QtGui.QColor(255, 0, 0))
     _target_brush = QtGui.QBrush(QtGui.QColor(0, 0, 255))
     _selected_brush = QtGui.QBrush(QtGui.QColor(163, 190, 140))
+    # Path gradient from red at the start to blue at the end, sampled at
+    # 256 hues.
+    _HUE_LUT: t.ClassVar[t.Tuple[QtGui.QColor, ...]] = tuple(
+        QtGui.QColor(*(
+            floor(255 * c)
+            for c in colorsys.hls_to_rgb(2 / 3 * hue_idx / 255, 0.5, 1)
+        ))
+        for hue_idx in range(256)
+    )
+    _HUE_BRUSHES: t.ClassVar[t.Tuple[QtGui.QBrush, ...]] = tuple(
+        QtGui.QBrush(color) for color in _HUE_LUT
+    )
 
     def __init__(self, rows: int, columns: int, *args: t.Any, **kwargs: t.Any):
         """."""
-        super().__init__(rows, columns, *args, **kwargs)
+        # The model owns the solving state, the grid and the algorithm; the
+        # widget only reads them. It is created first so that
+        # GridWidget.__init__ can assign the grid through the grid property.
         self.model: SolverModel = SolverModel(
-            grid=self.grid,
+            grid=GridMatrix(rows, columns),
             source=(rows - 1, columns - 1),
             target=(0, 0),
+            algorithm=AStarAlgorithm(),
         )
-        self.model.add_observer(self.update)
+        super().__init__(rows, columns, *args, **kwargs)
+        # Repaint requests made during one event loop turn share a single
+        # update() call over the union of their rectangles.
+        self._dirty_rect = QtCore.QRect()
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._flush_update)
 
-        self.algorithm: PathFindingAlgorithm = AStarAlgorithm()
+        # Composed scene and the part of it that is out of date.
+        self._scene = QtGui.QPixmap()
+        self._scene_dirty = QtGui.QRegion()
+
+        # Canvas area of the current path and the number of used cells
+        # already repainted, for repainting only what a solve step changes.
+        self._path_rect = QtCore.QRect()
+        self._dirty_used_count = 0
+
+        self.model.add_observer(self._on_model_changed)
 
         self.draw_mode: DrawMode = DrawMode.walls
+        # Cell of the last mouse move, so moves within it are ignored.
+        self._last_mouse_cell: t.Optional[Cell] = None
+        # Cells entered by the mouse but not applied yet.
+        self._pending_mouse_cells: t.List[Cell] = []
+        self._mouse_timer = QtCore.QTimer(self)
+        self._mouse_timer.setSingleShot(True)
+        self._mouse_timer.setInterval(self._MOUSE_INTERVAL_MS)
+        self._mouse_timer.timeout.connect(self._flush_mouse)
         self.installEventFilter(self)
 
         self._interval: int = 100
         self._state: SolverStateType = SolverStateType.viewing
-        self._state_obj: t.Any = ViewingState()
+        self._state_obj: SolverState = _STATE_OBJECTS[self._state]
         self._state_changed: t.List[t.Callable[[], None]] = []
 
         self.thread: t.Optional[SolverThread] = None
 
-        self._settings = QtCore.QSettings('Labyrinth', 'SolverGridWidget')
+        # Path shown in the solved state, None until the worker delivers it.
+        self._result_path: t.Optional[t.List[Cell]] = None
+        self._result_worker: t.Optional[SolveWorker] = None
+
+        # Interval changes are written after a quiet period, and only if
+        # they differ from what the settings already hold.
+        self._saved_interval: t.Optional[int] = None
+        self._settings_writer = SettingsWriter(
+            _SETTINGS.organizationName(), _SETTINGS.applicationName(),
+        )
+        self._settings_timer = QtCore.QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(self._SETTINGS_DELAY_MS)
+        self._settings_timer.timeout.connect(self._save_settings)
+        application = QtCore.QCoreApplication.instance()
+        if application is not None:
+            application.aboutToQuit.connect(self._flush_settings)
         self._load_settings()
 
-        self._used_path = QtGui.QPainterPath()
+        # Visited cells are painted once into this canvas-sized overlay,
+        # which tracks how many of the model's used cells it holds.
+        self._used_overlay = QtGui.QPixmap()
+        self._used_overlay_count = 0
+
+        # Recorded source and target cells, keyed by what they depend on.
+        self._source_target_picture = QtGui.QPicture()
+        self._source_target_key: t.Optional[t.Tuple[float, Cell, Cell]] = None
         self.set_state(self._state)
 
     def set_state(self, new_state: SolverStateType):
         """Change the current state of the widget and notify observers."""
         old_state = self._state
         if old_state != new_state:
+            self._flush_mouse()
             self._state_obj.on_exit(self)
             self._state = new_state
-            self._state_obj = {
-                SolverStateType.viewing: ViewingState(),
-                SolverStateType.drawing: DrawingState(),
-                SolverStateType.erasing: ErasingState(),
-                SolverStateType.solving: SolvingState(),
-                SolverStateType.solved: SolvedState(),
-            }[new_state]
+            self._last_mouse_cell = None
+            self._state_obj = _STATE_OBJECTS[new_state]
             self._state_obj.on_enter(self)
 
             for callback in self._state_changed:
                 callback()
-            self.update()
+            self._request_update()
+
+    def _request_update(self, rect: t.Optional[QtCore.QRect] = None):
+        """
+        Schedule a repaint of rect, or of the whole widget, on the next event
+        loop turn.
+        """
+        if rect is None:
+            rect = self.rect()
+        self._dirty_rect = self._dirty_rect.united(rect)
+        self._scene_dirty += rect
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _flush_update(self):
+        """Repaint the area collected by _request_update."""
+        rect, self._dirty_rect = self._dirty_rect, QtCore.QRect()
+        if not rect.isEmpty():
+            self.update(rect)
+
+    def _on_model_changed(self):
+        """
+        Repaint after a model change.
+
+        While solving, a step only changes the current path and the newly
+        visited cells, so only their area is repainted.
+        """
+        used = self.model.get_used_order()
+        if self._dirty_used_count > len(used):
+            self._dirty_used_count = 0
+
+        if self._state != SolverStateType.solving:
+            self._path_rect = QtCore.QRect()
+            self._dirty_used_count = len(used)
+            self._request_update()
+            return
+
+        path_rect = self._cells_rect(self.model.get_current_path_cache())
+        self._request_update(
+            self._cells_rect(used[self._dirty_used_count:])
+            .united(path_rect)
+            .united(self._path_rect),
+        )
+        self._path_rect = path_rect
+        self._dirty_used_count = len(used)
+
+    def _cells_rect(self, cells: t.Sequence[Cell]) -> QtCore.QRect:
+        """Get the widget area covering the given cells, outlines included."""
+        area = self._cells_canvas_rect(cells)
+        if area.isEmpty():
+            return area
+        return area.translated(self._canvas_left, self._canvas_top)
+
+    @property
+    def grid(self) -> GridMatrix:
+        """Get the grid, which is owned by the model."""
+        return self.model.grid
+
+    @grid.setter
+    def grid(self, grid: GridMatrix):
+        """Replace the grid of the model."""
+        self.model.grid = grid
+
+    @property
+    def algorithm(self) -> PathFindingAlgorithm:
+        """Get the pathfinding algorithm, which is owned by the model."""
+        return self.model.algorithm
 
     def set_algorithm(self, algorithm: PathFindingAlgorithm):
         """Set the pathfinding algorithm to use."""
-        self.algorithm = algorithm
         self.model.set_algorithm(algorithm)
 
     def paintEvent(self, event: QtGui.QPaintEvent):
-        """Paint the grid and visualization."""
-        self._render_grid_pixmap()
+        """
+        Paint the grid and visualization.
+
+        The scene is composed into a widget-sized pixmap, and only the areas
+        changed since the last paint are redrawn into it; repaints with
+        nothing changed, such as expose events, just blit the pixmap.
+        """
+        ratio = self.devicePixelRatioF()
+        scene_size = self.size() * ratio
+        if self._scene.size() != scene_size:
+            self._scene = QtGui.QPixmap(scene_size)
+            self._scene.setDevicePixelRatio(ratio)
+            self._scene_dirty = QtGui.QRegion(self.rect())
+        elif self._grid_dirty:
+            self._scene_dirty = QtGui.QRegion(self.rect())
+
+        if not self._scene_dirty.isEmpty():
+            self._compose_scene(self._scene_dirty)
+            self._scene_dirty = QtGui.QRegion()
+
         painter = QtGui.QPainter(self)
-        painter.translate(0.5, 0.5)
-        painter.setRenderHints(painter.Antialiasing)
+        painter.drawPixmap(0, 0, self._scene)
+        super().paintEvent(event)
+        painter.end()
+
+    def _compose_scene(self, region: QtGui.QRegion):
+        """Redraw the given region of the scene pixmap."""
+        if self._grid_dirty:
+            self._render_grid_pixmap()
+        painter = QtGui.QPainter(self._scene)
+        painter.setClipRegion(region)
+        painter.fillRect(region.boundingRect(), self.palette().window())
 
         painter.drawPixmap(
             self._canvas_left,
@@ -99,13 +269,12 @@ class SolverGridWidget(GridWidget):
         self._draw_source_and_target(painter)
 
         if self._state == SolverStateType.solving:
-            self._update_used_path()
+            self._update_used_overlay()
             self._draw_current_solve_step(painter)
         elif self._state == SolverStateType.solved:
-            self._update_used_path()
+            self._update_used_overlay()
             self._draw_result(painter)
 
-        super().paintEvent(event)
         painter.end()
 
     def eventFilter(
@@ -114,46 +283,82 @@ class SolverGridWidget(GridWidget):
             event: QtCore.QEvent,
     ) -> bool:
         """Filter events to handle state-specific input."""
-        self._state_obj.handle_input(self, event)
+        if event.type() in self._state_obj.accepted_events:
+            self._state_obj.handle_input(self, event)
         return super().eventFilter(source, event)
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent):
         """
         Handle mouse movement for drawing/erasing walls or setting
         source/target.
+
+        Cells under the cursor are queued and applied together at most once
+        per frame by _flush_mouse.
         """
         left, top = self._canvas_left, self._canvas_top
         width, height = self._canvas_width, self._canvas_height
+        size = self._square_size
 
         x = event.pos().x()
         y = event.pos().y()
 
-        i = floor((x - left) / self._square_size)
-        j = floor((y - top) / self._square_size)
+        i = floor((x - left) / size)
+        j = floor((y - top) / size)
+
+        # Moves within the cell handled last cannot change anything.
+        if (j, i) == self._last_mouse_cell:
+            super().mouseMoveEvent(event)
+            return
+        self._last_mouse_cell = (j, i)
 
         if (left <= x <= left + width) and (top <= y <= top + height):
-            if self.draw_mode == DrawMode.walls:
-                if self._state == SolverStateType.drawing:
-                    self.grid.try_set_cell((j, i))
-                    self.invalidate_cache()
-                elif self._state == SolverStateType.erasing:
-                    self.grid.try_reset_cell((j, i))
-                    self.invalidate_cache()
-
-            elif self.draw_mode == DrawMode.target:
-                if self._state == SolverStateType.drawing:
-                    if not self.grid.get_cell((j, i)):
-                        self.model.target = (j, i)
-
-            elif self.draw_mode == DrawMode.source:
-                if self._state == SolverStateType.drawing:
-                    if not self.grid.get_cell((j, i)):
-                        self.model.source = (j, i)
-
-            self.update()
+            self._pending_mouse_cells.append((j, i))
+            if not self._mouse_timer.isActive():
+                self._mouse_timer.start()
 
         super().mouseMoveEvent(event)
 
+    def _flush_mouse(self):
+        """
+        Apply the cells queued by mouse movement in the current state.
+
+        Only the area around the touched cells is repainted.
+        """
+        self._mouse_timer.stop()
+        cells, self._pending_mouse_cells = self._pending_mouse_cells, []
+        if not cells:
+            return
+
+        if self.draw_mode == DrawMode.walls:
+            if self._state == SolverStateType.drawing:
+                set_cell = self.grid.try_set_cell
+                for cell in cells:
+                    set_cell(cell)
+                self.invalidate_cells(cells)
+            elif self._state == SolverStateType.erasing:
+                reset_cell = self.grid.try_reset_cell
+                for cell in cells:
+                    reset_cell(cell)
+                self.invalidate_cells(cells)
+            else:
+                return
+
+        elif self._state == SolverStateType.drawing:
+            # The old positions must be repainted along with the new ones.
+            moved = [self.model.source, self.model.target]
+            for cell in cells:
+                if not self.grid.get_cell(cell):
+                    if self.draw_mode == DrawMode.target:
+                        self.model.target = cell
+                    else:
+                        self.model.source = cell
+            cells = moved + [self.model.source, self.model.target]
+
+        else:
+            return
+
+        self._request_update(self._cells_rect(cells))
+
     def resize_grid(self, rows: int, columns: int):
         """Resize the grid and adjust source/target positions if needed."""
         self.grid.try_resize(rows, columns)
@@ -173,15 +378,11 @@ class SolverGridWidget(GridWidget):
             self.grid.try_reset_cell(self.model.source)
 
         self._update_layout()
-        self.update()
+        self._request_update()
 
     def solve(self) -> t.List[Cell]:
         """Solve the pathfinding problem and return the path."""
-        return self.algorithm.solve(
-            grid=self.grid,
-            source=self.model.source,
-            target=self.model.target,
-        )
+        return self.model.solve()
 
     def add_state_callback(self, callback: t.Callable[[], None]):
         """Add a callback to be called when the state changes."""
@@ -198,7 +399,7 @@ class SolverGridWidget(GridWidget):
         """Set the animation interval."""
         if self._state == SolverStateType.viewing:
             self._interval = new_value
-            self._save_settings()
+            self._settings_timer.start()
 
     @property
     def state(self) -> SolverStateType:
@@ -213,6 +414,7 @@ class SolverGridWidget(GridWidget):
     def start_solving(self):
         """Start the solving process in a separate thread."""
         self.model.reset()
+        self._used_overlay = QtGui.QPixmap()
         fixed_interval = int(
              self._interval * 1_000 / (self.grid.rows * self.grid.columns)
         )
@@ -223,106 +425,183 @@ class SolverGridWidget(GridWidget):
             target=self.model.target,
             interval_ms=fixed_interval,
         )
-        self.thread.step_signal.connect(self._on_step_received)
+        self.thread.steps_signal.connect(self._on_steps_received)
         self.thread.finished_signal.connect(self._on_solving_finished)
         self.thread.start()
         self.set_state(SolverStateType.solving)
 
+    def start_result_solve(self):
+        """
+        Solve for the result path on the global thread pool, unless the
+        model already has it cached.
+        """
+        self._result_path = self.model.get_cached_path()
+        if self._result_path is not None:
+            self._result_worker = None
+            return
+
+        self._result_worker = SolveWorker(
+            algorithm=self.algorithm,
+            grid=self.grid,
+            source=self.model.source,
+            target=self.model.target,
+        )
+        self._result_worker.signals.finished.connect(self._on_result_solved)
+        QtCore.QThreadPool.globalInstance().start(self._result_worker)
+
+    def discard_result(self):
+        """Drop the result path and ignore any solve still running."""
+        self._result_path = None
+        self._result_worker = None
+
+    def _on_result_solved(self, path: t.List[Cell]):
+        """Handle the result path produced by the solve worker."""
+        if (
+                self._result_worker is None
+                or self.sender() is not self._result_worker.signals
+        ):
+            return
+
+        self._result_worker = None
+        if path:
+            self.model.cache_path(path)
+            self._result_path = path
+            self._request_update()
+        else:
+            self.set_state(SolverStateType.viewing)
+            QtCore.QTimer.singleShot(0, self._show_no_path_error)
+
     def _load_settings(self):
         """Load settings from QSettings."""
-        self._interval = self._settings.value("interval", 100, type=int)
+        self._interval = _SETTINGS.value("interval", 100, type=int)
+        self._saved_interval = self._interval
 
     def _save_settings(self):
-        """Save settings to QSettings."""
-        self._settings.setValue("interval", self._interval)
+        """Save settings to QSettings unless they are unchanged."""
+        if self._interval != self._saved_interval:
+            self._settings_writer.write("interval", self._interval)
+            self._saved_interval = self._interval
 
-    def _on_step_received(self, step: SolveStep):
-        """Handle a step received from the solver thread."""
-        self.model.apply_step(step)
+    def _flush_settings(self):
+        """
+        Save settings right away if a delayed save is pending, and wait for
+        the writer to finish.
+        """
+        if self._settings_timer.isActive():
+            self._settings_timer.stop()
+            self._save_settings()
+        self._settings_writer.wait()
+
+    def _on_steps_received(self, steps: t.List[SolveStep]):
+        """Handle a batch of steps received from the solver thread."""
+        self.model.apply_steps(steps)
 
     def _on_solving_finished(self):
         """Handle the end of the solving process."""
         self.set_state(SolverStateType.solved)
 
     def _draw_source_and_target(self, painter: QtGui.QPainter):
-        """Draw the source and target cells on the painter."""
-        left, top = self._canvas_left, self._canvas_top
-        rectangle = QtCore.QRectF(0, 0, self._square_size, self._square_size)
+        """
+        Draw the source and target cells on the painter.
 
-        painter.setOpacity(1)
-        painter.setBrush(SolverGridWidget._target_brush)
-        painter.drawRect(rectangle.translated(
-            left + self.model.target[1] * self._square_size,
-            top + self.model.target[0] * self._square_size,
-        ))
+        The two cells are recorded into a picture that is replayed until the
+        cell size, source or target changes.
+        """
+        size = self._square_size
+        key = (size, self.model.source, self.model.target)
+        if key != self._source_target_key:
+            self._source_target_key = key
+            self._source_target_picture = QtGui.QPicture()
+            recorder = QtGui.QPainter(self._source_target_picture)
+            rectangle = QtCore.QRectF(0, 0, size, size)
+
+            recorder.setBrush(SolverGridWidget._target_brush)
+            rectangle.moveTo(
+                self.model.target[1] * size, self.model.target[0] * size,
+            )
+            recorder.drawRect(rectangle)
+
+            recorder.setBrush(SolverGridWidget._source_brush)
+            rectangle.moveTo(
+                self.model.source[1] * size, self.model.source[0] * size,
+            )
+            recorder.drawRect(rectangle)
+            recorder.end()
 
-        painter.setBrush(SolverGridWidget._source_brush)
-        painter.drawRect(rectangle.translated(
-            left + self.model.source[1] * self._square_size,
-            top + self.model.source[0] * self._square_size,
-        ))
+        painter.setOpacity(1)
+        painter.drawPicture(
+            self._canvas_left, self._canvas_top, self._source_target_picture,
+        )
 
     def _draw_current_solve_step(self, painter: QtGui.QPainter):
         """Draw the current step of the solving process."""
 
         painter.setOpacity(0.5)
-        painter.setBrush(SolverGridWidget._used_brush)
-        painter.drawPath(self._used_path)
-
-        current_path = self.model.get_current_path_cache()
-        if current_path:
-            painter.setOpacity(1)
-            for node_idx, node in enumerate(current_path):
-                if len(current_path) > 1:
-                    hue = 2 / 3 * node_idx / (len(current_path) - 1)
-                    rgb_color = colorsys.hls_to_rgb(hue, 0.5, 1)
-                    r, g, b = (floor(255 * c) for c in rgb_color)
-                    color = QtGui.QColor(r, g, b)
-                else:
-                    color = SolverGridWidget._selected_brush.color()
-
-                painter.setBrush(color)
-                x = self._canvas_left + node[1] * self._square_size
-                y = self._canvas_top + node[0] * self._square_size
-                painter.drawRect(
-                    QtCore.QRectF(
-                        x, y, self._square_size, self._square_size,
-                    )
-                )
+        painter.drawPixmap(
+            self._canvas_left, self._canvas_top, self._used_overlay,
+        )
+
+        self._draw_path(painter, self.model.get_current_path_cache())
 
     def _draw_result(self, painter: QtGui.QPainter):
         """Draw the final result of the pathfinding."""
         painter.setOpacity(0.33)
-        painter.setBrush(SolverGridWidget._used_brush)
-        painter.drawPath(self._used_path)
-
-        result = self.algorithm.solve(
-            grid=self.grid,
-            source=self.model.source,
-            target=self.model.target,
+        painter.drawPixmap(
+            self._canvas_left, self._canvas_top, self._used_overlay,
         )
-        if result:
-            painter.setOpacity(1)
-            for node_idx, node in enumerate(result):
-                if len(result) > 1:
-                    hue = 2 / 3 * node_idx / (len(result) - 1)
-                    rgb_color = colorsys.hls_to_rgb(hue, 0.5, 1)
-                    r, g, b = (floor(255 * c) for c in rgb_color)
-                    color = QtGui.QColor(r, g, b)
-                else:
-                    color = SolverGridWidget._selected_brush.color()
-
-                painter.setBrush(color)
-                x = self._canvas_left + node[1] * self._square_size
-                y = self._canvas_top + node[0] * self._square_size
-                painter.drawRect(
-                    QtCore.QRectF(
-                        x, y, self._square_size, self._square_size,
-                    )
-                )
-        else:
-            self.set_state(SolverStateType.viewing)
-            QtCore.QTimer.singleShot(0, self._show_no_path_error)
+
+        if self._result_path:
+            self._draw_path(painter, self._result_path)
+
+    def _draw_path(self, painter: QtGui.QPainter, path: t.List[Cell]):
+        """
+        Draw a path colored from start to end along a hue gradient.
+
+        Brushes come from a 256 entry lookup table. The cells sharing an
+        entry form a contiguous span, cached per path length, so each color
+        takes a single drawRects call.
+        """
+        if not path:
+            return
+
+        left, top = self._canvas_left, self._canvas_top
+        size = self._square_size
+        painter.setOpacity(1)
+        if len(path) == 1:
+            row, column = path[0]
+            painter.setBrush(SolverGridWidget._selected_brush)
+            painter.drawRect(QtCore.QRectF(
+                left + column * size, top + row * size, size, size,
+            ))
+            return
+
+        ys, xs = self._row_offsets, self._column_offsets
+        painter.save()
+        painter.translate(left, top)
+        for hue_idx, start, end in self._hue_spans(len(path)):
+            painter.setBrush(self._HUE_BRUSHES[hue_idx])
+            painter.drawRects([
+                QtCore.QRectF(xs[column], ys[row], size, size)
+                for row, column in path[start:end]
+            ])
+        painter.restore()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _hue_spans(length: int) -> t.Tuple[t.Tuple[int, int, int], ...]:
+        """
+        Split a path of the given length into (hue index, start, end) spans
+        of consecutive nodes that share a hue table entry.
+        """
+        last = length - 1
+        spans = []
+        start = 0
+        for hue_idx in range(256):
+            end = min(-(-(hue_idx + 1) * last // 255), length)
+            if end > start:
+                spans.append((hue_idx, start, end))
+                start = end
+        return tuple(spans)
 
     def _show_no_path_error(self):
         """Show an error message if no path exists."""
@@ -336,14 +615,35 @@ class SolverGridWidget(GridWidget):
         message_box.setWindowTitle('Error')
         message_box.exec()
 
-    def _update_used_path(self):
-        """Update the QPainterPath for used cells to optimize drawing."""
-        path = QtGui.QPainterPath()
-        rect = QtCore.QRectF(0, 0, self._square_size, self._square_size)
-
-        for row, col in self.model.get_used_cells():
-            x = self._canvas_left + col * self._square_size
-            y = self._canvas_top + row * self._square_size
-            path.addRect(rect.translated(x, y))
+    def _update_used_overlay(self):
+        """
+        Paint cells visited since the last paint into the used overlay.
 
-        self._used_path = path
+        The overlay is recreated from scratch when the canvas size changes
+        or a new solve starts.
+        """
+        if (
+                self._used_overlay.width() != self._canvas_width
+                or self._used_overlay.height() != self._canvas_height
+        ):
+            self._used_overlay = QtGui.QPixmap(
+                self._canvas_width, self._canvas_height,
+            )
+            self._used_overlay.fill(QtCore.Qt.transparent)
+            self._used_overlay_count = 0
+
+        used = self.model.get_used_order()
+        if self._used_overlay_count == len(used):
+            return
+
+        size = self._square_size
+        ys, xs = self._row_offsets, self._column_offsets
+        painter = QtGui.QPainter(self._used_overlay)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setBrush(SolverGridWidget._used_brush)
+        painter.drawRects([
+            QtCore.QRectF(xs[column], ys[row], size, size)
+            for row, column in used[self._used_overlay_count:]
+        ])
+        painter.end()
+        self._used_overlay_count = len(used)
@@ -22,6 +22,11 @@ class SolverState(ABC):
     Abstract base class for solver states.
     Defines the interface for state behavior.
     """
+    # Event types passed to handle_input; the widget skips the call for
+    # any other event.
+    accepted_events: t.ClassVar[t.FrozenSet[QtCore.QEvent.Type]] = (
+        frozenset()
+    )
 
     @abstractmethod
     def on_enter(self, widget: "SolverGridWidget"):
@@ -43,6 +48,7 @@ class ViewingState(SolverState):
     """
     State for viewing the grid without interaction.
     """
+    accepted_events = frozenset((QtCore.QEvent.MouseButtonPress,))
 
     def on_enter(self, widget: "SolverGridWidget"):
         """Called when entering the viewing state."""
@@ -63,6 +69,7 @@ class ViewingState(SolverState):
 
 class DrawingState(SolverState):
     """State for drawing walls on the grid."""
+    accepted_events = frozenset((QtCore.QEvent.MouseButtonRelease,))
 
     def on_enter(self, widget: "SolverGridWidget"):
         """Called when entering the drawing state."""
@@ -80,6 +87,7 @@ class DrawingState(SolverState):
 
 class ErasingState(SolverState):
     """State for erasing walls from the grid."""
+    accepted_events = frozenset((QtCore.QEvent.MouseButtonRelease,))
 
     def on_enter(self, widget: "SolverGridWidget"):
         """Called when entering the erasing state."""
@@ -116,12 +124,12 @@ class SolvedState(SolverState):
     """State for displaying the solved path."""
 
     def on_enter(self, widget: "SolverGridWidget"):
-        """Called when entering the solved state."""
-        pass
+        """Solve for the result path in the background."""
+        widget.start_result_solve()
 
     def on_exit(self, widget: "SolverGridWidget"):
-        """Called when exiting the solved state."""
-        pass
+        """Drop the result path, which edits made next would invalidate."""
+        widget.discard_result()
 
     def handle_input(self, widget: "SolverGridWidget", event: QtCore.QEvent):
         """No input handling in solved state."""
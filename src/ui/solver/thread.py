@@ -1,4 +1,7 @@
+import threading
 import time
+import typing as t
+from math import ceil
 
 import PyQt5.QtCore as QtCore
 
@@ -11,9 +14,14 @@ class SolverThread(QtCore.QThread):
     A thread for running the pathfinding algorithm and emitting steps
     for visualization.
     """
-    step_signal = QtCore.pyqtSignal(SolveStep)
+    # Declared as object so the list is passed by reference instead of
+    # being converted to and from a QVariantList.
+    steps_signal = QtCore.pyqtSignal(object)
     finished_signal = QtCore.pyqtSignal()
 
+    # Steps produced within one frame are emitted together.
+    FRAME_SECONDS: t.ClassVar[float] = 0.016
+
     def __init__(
             self,
             algorithm: PathFindingAlgorithm,
@@ -29,28 +37,136 @@ class SolverThread(QtCore.QThread):
         self.target = target
         self.interval_ms = interval_ms
         self.skip_flag = False
+        # Released by skip() to cut short the wait between steps.
+        self._skip_semaphore = QtCore.QSemaphore(0)
 
     def skip(self):
         """Set the stop flag to request the thread to stop."""
         self.skip_flag = True
+        self._skip_semaphore.release()
 
     def run(self):
         """
         Execute the algorithm's solve_trace and emit steps via signals.
+        Steps are emitted in batches of at most one frame's worth, and once
+        skipped, the remaining steps are emitted as a single batch.
         Emit finished_signal when done or on error.
         """
         try:
-            for step in self.algorithm.solve_trace(
-                    grid=self.grid,
-                    source=self.source,
-                    target=self.target,
-            ):
-                if not self.skip_flag:
-                    time.sleep(self.interval_ms / 1000.0)
+            steps = self.algorithm.solve_trace(
+                grid=self.grid,
+                source=self.source,
+                target=self.target,
+            )
+            batch: t.List[SolveStep] = []
+            interval = self.interval_ms / 1000.0
+            emitted_at = deadline = time.monotonic()
+            for step in steps:
+                if self.skip_flag:
+                    batch.append(step)
+                    batch.extend(steps)
+                    break
 
-                self.step_signal.emit(step)
+                # Steps are paced against a fixed schedule, so the time
+                # spent producing them does not add up to a drift.
+                deadline += interval
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    self._skip_semaphore.tryAcquire(1, ceil(delay * 1000))
+                batch.append(step)
+                now = time.monotonic()
+                if now - emitted_at >= self.FRAME_SECONDS:
+                    self.steps_signal.emit(batch)
+                    batch = []
+                    emitted_at = now
 
+            if batch:
+                self.steps_signal.emit(batch)
             self.finished_signal.emit()
         except Exception as e:
             print(f"Solver thread error: {e}")
             self.finished_signal.emit()
+
+
+class SolveWorkerSignals(QtCore.QObject):
+    """Signals of SolveWorker; QRunnable itself cannot emit them."""
+    finished = QtCore.pyqtSignal(object)
+
+
+class SolveWorker(QtCore.QRunnable):
+    """
+    A thread pool task that runs the algorithm's solve and emits the
+    resulting path.
+    """
+
+    def __init__(
+            self,
+            algorithm: PathFindingAlgorithm,
+            grid: GridMatrix,
+            source: Cell,
+            target: Cell,
+    ):
+        super().__init__()
+        self.algorithm = algorithm
+        self.grid = grid
+        self.source = source
+        self.target = target
+        self.signals = SolveWorkerSignals()
+
+    def run(self):
+        """Solve and emit the path, or an empty path on error."""
+        try:
+            path = self.algorithm.solve(
+                grid=self.grid,
+                source=self.source,
+                target=self.target,
+            )
+        except Exception as e:
+            print(f"Solve worker error: {e}")
+            path = []
+
+        self.signals.finished.emit(path)
+
+
+class SettingsWriter(QtCore.QThread):
+    """
+    A thread that writes settings values off the GUI thread.
+
+    Values written while a write is in progress are merged by key and
+    written in the next batch. The thread exits once nothing is pending
+    and is started again by the next write.
+    """
+
+    def __init__(self, organization: str, application: str):
+        super().__init__()
+        self.organization = organization
+        self.application = application
+        self._lock = threading.Lock()
+        self._pending: t.Dict[str, t.Any] = {}
+        self._writing = False
+
+    def write(self, key: str, value: t.Any):
+        """Queue a settings value to be written."""
+        with self._lock:
+            self._pending[key] = value
+            if self._writing:
+                return
+            self._writing = True
+
+        # The previous batch may still be returning from run().
+        self.wait()
+        self.start()
+
+    def run(self):
+        """Write and sync pending values until none are left."""
+        settings = QtCore.QSettings(self.organization, self.application)
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._writing = False
+                    break
+                pending, self._pending = self._pending, {}
+
+            for key, value in pending.items():
+                settings.setValue(key, value)
+            settings.sync()